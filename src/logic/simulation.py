@@ -1,6 +1,78 @@
 from queue import Queue
-from random import expovariate
+from random import expovariate, Random
+from math import exp, sqrt
 from enum import Enum
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _generate_busy_cycles(lamda, mu, cycles, seed):
+    """
+    Generates i.i.d. regeneration cycles of an M/M/1 queue (rates are minutely).
+    A cycle starts when the system becomes empty (the idle period) and ends at the next
+    departure that leaves the system empty again (the end of the busy period).
+    Returns a list of per-cycle sums.
+    This is a module-level function so that it can be sent to worker processes.
+    """
+
+    rng = Random(seed)
+    results = []
+
+    for _ in range(cycles):
+
+        # Idle period
+        current_time = rng.expovariate(lamda)
+        customers_in_system = 1
+        in_service_arrival_time = current_time
+        waiting_queue = deque()
+
+        next_arrival_time = current_time + rng.expovariate(lamda)
+        next_departure_time = current_time + rng.expovariate(mu)
+
+        cycle = {
+            "length": 0.0,
+            "customers": 0,
+            "busy_time": 0.0,
+            "area_in_system": 0.0,
+            "area_in_queue": 0.0,
+            "time_in_queue": 0.0,
+            "time_in_system": 0.0,
+            "time_with_n": [current_time, 0.0, 0.0, 0.0]
+        }
+
+        # Busy period
+        while customers_in_system > 0:
+            prev_time = current_time
+            current_time = min(next_arrival_time, next_departure_time)
+            duration = current_time - prev_time
+
+            cycle["area_in_system"] += customers_in_system * duration
+            cycle["area_in_queue"] += (customers_in_system - 1) * duration
+            if customers_in_system < 4:
+                cycle["time_with_n"][customers_in_system] += duration
+
+            # HANDLE ARRIVAL
+            if next_arrival_time < next_departure_time:
+                customers_in_system += 1
+                waiting_queue.append(current_time)
+                next_arrival_time = current_time + rng.expovariate(lamda)
+
+            # HANDLE DEPARTURE
+            else:
+                customers_in_system -= 1
+                cycle["customers"] += 1
+                cycle["time_in_system"] += current_time - in_service_arrival_time
+
+                if waiting_queue:
+                    in_service_arrival_time = waiting_queue.popleft()
+                    cycle["time_in_queue"] += current_time - in_service_arrival_time
+                    next_departure_time = current_time + rng.expovariate(mu)
+
+        cycle["length"] = current_time
+        cycle["busy_time"] = current_time - cycle["time_with_n"][0]
+        results.append(cycle)
+
+    return results
 
 class QueueSimulator:
 
@@ -14,6 +86,13 @@ class QueueSimulator:
     MU = TO_MINUTELY_RATE(12)                     # minutely rate
     LAMDA = TO_MINUTELY_RATE(6)                 # minutely rate
 
+    TAIL_TIME = 300                                 # in minutes
+    REPLICATIONS = int(1e4)
+    Z_95 = 1.96
+
+    REGENERATIVE_CYCLES = int(1e5)
+    WORKERS = 1
+
     class QueueEvent(Enum):
         ARRIVAL = 0,
         DEPARTURE = 1
@@ -287,6 +366,166 @@ class QueueSimulator:
     # Print Queue metrics
     # -----------------------------
 
+    # -----------------------------
+    # Rare-event (importance sampling) simulation
+    # -----------------------------
+
+    def __twisted_tail_replication(self, tail_time):
+        """
+        Runs one importance-sampling replication of the waiting-time random walk.
+        By Lindley's recursion the steady-state Wq has the law of the maximum of the walk
+        with increments (service time - interarrival time), started from an empty system.
+        Under the exponential twist the rates are swapped (services ~ Exp(lamda), interarrivals ~ Exp(mu)),
+        so the walk drifts upwards and always crosses tail_time within the busy cycle.
+        Returns the likelihood ratio exp(-(mu - lamda) * S) evaluated at the crossing level S.
+        """
+
+        level = 0.0
+        while level <= tail_time:
+            level += expovariate(self.lamda) - expovariate(self.mu)
+
+        return exp(-(self.mu - self.lamda) * level)
+
+    def run_rare_event_simulation(self, lamda=LAMDA, mu=MU, tail_time=TAIL_TIME, replications=REPLICATIONS):
+        """
+        Estimates P(Wq > tail_time) with exponential twisting and likelihood-ratio weighting.
+        Rates are given per hour (as in run_simulation) and tail_time is in minutes.
+        Every replication is an unbiased estimate, so the sample mean is unbiased as well.
+        """
+
+        if tail_time < 0:
+            tail_time = QueueSimulator.TAIL_TIME
+
+        if replications <= 1:
+            replications = QueueSimulator.REPLICATIONS
+
+        self.lamda = QueueSimulator.TO_MINUTELY_RATE(lamda) if lamda > 0 else QueueSimulator.LAMDA
+        self.mu = QueueSimulator.TO_MINUTELY_RATE(mu) if mu > 0 else QueueSimulator.MU
+
+        if self.lamda >= self.mu:
+            raise ValueError("The rare-event estimator requires a stable queue (lamda < mu).")
+
+        total_weight = 0.0
+        total_squared_weight = 0.0
+
+        for _ in range(replications):
+            weight = self.__twisted_tail_replication(tail_time)
+            total_weight += weight
+            total_squared_weight += weight ** 2
+
+        # Calculate tail probability estimate and its diagnostics
+        mean = total_weight / replications
+        variance = max(total_squared_weight / replications - mean ** 2, 0.0) * replications / (replications - 1)
+
+        self.tail_time = tail_time
+        self.replications = replications
+        self.tail_probability = mean
+        self.tail_std_error = sqrt(variance / replications)
+        self.tail_relative_error = self.tail_std_error / mean if mean > 0 else float("inf")
+        self.tail_confidence_interval = (mean - QueueSimulator.Z_95 * self.tail_std_error,
+                                         mean + QueueSimulator.Z_95 * self.tail_std_error)
+
+    def print_rare_event_results(self):
+        print(f"Tail probability P(Wq > {self.tail_time} minutes): {self.tail_probability:.4e}")
+        print(f"Standard error: {self.tail_std_error:.4e} , relative error: {self.tail_relative_error:.4%}")
+        print(f"95% confidence interval: ({self.tail_confidence_interval[0]:.4e}, {self.tail_confidence_interval[1]:.4e})")
+        print(f"Replications: {self.replications}")
+
+    # -----------------------------
+    # Regenerative (busy-cycle) simulation
+    # -----------------------------
+
+    def __ratio_estimate(self, cycles, numerator, denominator):
+        """
+        Forms the regenerative ratio estimator sum(Y) / sum(X) over i.i.d. cycles
+        and its 95% confidence interval from the variance of Y - r * X.
+        Returns the estimate and the confidence interval.
+        """
+
+        n = len(cycles)
+        y = [numerator(cycle) for cycle in cycles]
+        x = [denominator(cycle) for cycle in cycles]
+
+        ratio = sum(y) / sum(x)
+        mean_x = sum(x) / n
+
+        residuals = [y_i - ratio * x_i for y_i, x_i in zip(y, x)]
+        variance = sum(z ** 2 for z in residuals) / (n - 1)
+        half_width = QueueSimulator.Z_95 * sqrt(variance / n) / mean_x
+
+        return ratio, (ratio - half_width, ratio + half_width)
+
+    def run_regenerative_simulation(self, lamda=LAMDA, mu=MU, cycles=REGENERATIVE_CYCLES, workers=WORKERS):
+        """
+        Estimates the queue metrics from i.i.d. regeneration cycles (the system becoming empty).
+        Rates are given per hour (as in run_simulation).
+        The cycles can be generated across several worker processes; since they are independent,
+        the estimates have the same statistical guarantees as a single run of the same length.
+        """
+
+        self.__reset_data()
+
+        if cycles <= 1:
+            cycles = QueueSimulator.REGENERATIVE_CYCLES
+
+        if workers <= 0:
+            workers = QueueSimulator.WORKERS
+
+        self.lamda = QueueSimulator.TO_MINUTELY_RATE(lamda) if lamda > 0 else QueueSimulator.LAMDA
+        self.mu = QueueSimulator.TO_MINUTELY_RATE(mu) if mu > 0 else QueueSimulator.MU
+
+        if self.lamda >= self.mu:
+            raise ValueError("The regenerative estimator requires a stable queue (lamda < mu).")
+
+        # Split the cycles across the workers, each with its own random stream
+        workers = min(workers, cycles)
+        chunk_sizes = [cycles // workers + (1 if i < cycles % workers else 0) for i in range(workers)]
+        seeds = [Random().getrandbits(64) for _ in range(workers)]
+
+        if workers == 1:
+            self.cycles = _generate_busy_cycles(self.lamda, self.mu, cycles, seeds[0])
+        else:
+            self.cycles = []
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk in executor.map(_generate_busy_cycles, [self.lamda] * workers, [self.mu] * workers,
+                                          chunk_sizes, seeds):
+                    self.cycles.extend(chunk)
+
+        self.total_customers = sum(cycle["customers"] for cycle in self.cycles)
+        self.total_simulation_time = sum(cycle["length"] for cycle in self.cycles)
+
+        # Calculate Queue metrics as ratio estimators
+        length = lambda cycle: cycle["length"]
+        customers = lambda cycle: cycle["customers"]
+
+        self.confidence_intervals = {}
+
+        self.rho, self.confidence_intervals["rho"] = self.__ratio_estimate(self.cycles, lambda cycle: cycle["busy_time"], length)
+
+        self.L, self.confidence_intervals["L"] = self.__ratio_estimate(self.cycles, lambda cycle: cycle["area_in_system"], length)
+
+        self.Lq, self.confidence_intervals["Lq"] = self.__ratio_estimate(self.cycles, lambda cycle: cycle["area_in_queue"], length)
+
+        self.Ws, self.confidence_intervals["Ws"] = self.__ratio_estimate(self.cycles, lambda cycle: cycle["time_in_system"], customers)
+
+        self.Wq, self.confidence_intervals["Wq"] = self.__ratio_estimate(self.cycles, lambda cycle: cycle["time_in_queue"], customers)
+
+        self.P = []
+        self.confidence_intervals["P"] = []
+
+        for n in range(4):
+            p, interval = self.__ratio_estimate(self.cycles, lambda cycle: cycle["time_with_n"][n], length)
+            self.P.append(p)
+            self.confidence_intervals["P"].append(interval)
+
+    def print_regenerative_results(self):
+        self.print_results()
+        print(f"95% confidence intervals over {len(self.cycles)} cycles:")
+        for metric in ["rho", "L", "Lq", "Ws", "Wq"]:
+            low, high = self.confidence_intervals[metric]
+            print(f"  {metric}: ({low:.4f}, {high:.4f})")
+        print(f"  P0-P3: {', '.join(f'({low:.4f}, {high:.4f})' for low, high in self.confidence_intervals['P'])}")
+
     def print_results(self):
         print(f"Utilization factor (ρ): {self.rho:.4f}")
         print(f"Average number of customers in the system (L): {self.L:.4f}")
@@ -54,3 +54,26 @@ def calculate_queue_metrics(lamda, mu):
     }
 
     return results, data
+
+
+def calculate_waiting_time_tail(lamda, mu, t):
+    """
+    Calculate the waiting-time tail probability P(Wq > t) for an M/M/1 queue.
+
+    Parameters:
+    lamda (float): Arrival rate (customers per time unit)
+    mu (float): Service rate (customers served per time unit)
+    t (float): Waiting time threshold (same time unit as the rates)
+
+    Returns:
+    float: rho * exp(-(mu - lamda) * t)
+    """
+    if lamda <= 0 or mu <= 0 or lamda >= mu:
+        raise ValueError("Arrival rate and service rate must be greater than zero and lamda < mu.")
+
+    if t < 0:
+        return 1.0
+
+    rho = lamda / mu
+
+    return rho * np.exp(-(mu - lamda) * t)
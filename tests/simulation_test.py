@@ -4,7 +4,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 
 
 from simulation import QueueSimulator
-from theoritical import calculate_queue_metrics
+from theoritical import calculate_queue_metrics, calculate_waiting_time_tail
 
 
 
@@ -26,6 +26,27 @@ def present_simulation_results(lamda, mu):
 
 
 
+def present_rare_event_results(lamda, mu, tail_time):
+    # Rates are per hour, tail_time is in minutes
+    print("Theoretical tail probability:")
+    print(f"{calculate_waiting_time_tail(lamda, mu, tail_time / 60):.4e}")
+    print("-" * 50)
+
+    simulator = QueueSimulator()
+    simulator.run_rare_event_simulation(lamda, mu, tail_time)
+
+    print("Rare-event Simulation Results:")
+    simulator.print_rare_event_results()
+
+
+def present_regenerative_results(lamda, mu, workers):
+    simulator = QueueSimulator()
+    simulator.run_regenerative_simulation(lamda, mu, workers=workers)
+
+    print(f"Regenerative Simulation Results ({workers} workers):")
+    simulator.print_regenerative_results()
+
+
 def run_test(scenario):
     lamda = (scenario["lamda"])
     mu = (scenario["mu"])
@@ -51,6 +72,25 @@ if __name__ == "__main__":
         run_test(scenario)
         print("\n" + "="*50 + "\n")
 
+    # Regenerative tests (single process and parallel cycle generation)
+    for scenario in scenarios:
+        print(f"Running regenerative test with λ = {scenario['lamda']} hours, μ = {scenario['mu']} hours")
+        present_theoretical_results(scenario["lamda"], scenario["mu"])
+        present_regenerative_results(scenario["lamda"], scenario["mu"], workers=1)
+        present_regenerative_results(scenario["lamda"], scenario["mu"], workers=4)
+        print("\n" + "="*50 + "\n")
+
+    # Rare-event tests (tail_time many times the mean wait)
+    rare_event_scenarios = [
+        {"mu": 12, "lamda": 6, "tail_time": 300},
+        {"mu": 12, "lamda": 11, "tail_time": 1200}
+    ]
+
+    for scenario in rare_event_scenarios:
+        print(f"Running rare-event test with λ = {scenario['lamda']} hours, μ = {scenario['mu']} hours, t = {scenario['tail_time']} minutes")
+        present_rare_event_results(scenario["lamda"], scenario["mu"], scenario["tail_time"])
+        print("\n" + "="*50 + "\n")
+
 
 
 